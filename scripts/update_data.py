@@ -1,10 +1,35 @@
+import gzip
+import hashlib
+import http.client
 import json
 import os
-import urllib.request
-from datetime import datetime, timedelta, timezone
+import random
+import re
+import threading
+import time
+import urllib.error
+import urllib.parse
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from itertools import chain
+from zoneinfo import ZoneInfo
+
+try:
+    import orjson  # optional: much faster parse/dump of the big scoreboards
+except ImportError:
+    orjson = None
 
 REPO_ROOT = os.path.dirname(os.path.dirname(__file__))
 DATA_PATH = os.path.join(REPO_ROOT, "data.json")
+CACHE_DIR = os.path.join(REPO_ROOT, "cache")
+# Cache keys include the dates queried, so yesterday's ranges go unused;
+# anything not rewritten for this long is pruned
+CACHE_KEEP_SECONDS = 2 * 24 * 60 * 60
+
+# "Today" and game times follow the office's local (Central) time, DST included
+LOCAL_TZ = ZoneInfo("America/Chicago")
 
 ENDPOINTS = {
     "NFL":  "https://site.api.espn.com/apis/site/v2/sports/football/nfl/scoreboard",
@@ -14,67 +39,388 @@ ENDPOINTS = {
     "NCAA": "https://site.api.espn.com/apis/site/v2/sports/football/college-football/scoreboard?groups=80",
 }
 
+# Most ticker items kept per mode (today/finals), across all leagues;
+# also the most events read from any one scoreboard
+MAX_ITEMS = 250
+
+# One worker per scoreboard request (each league x today/finals), so
+# adding a league never queues its fetches behind the others
+FETCH_WORKERS = 2 * len(ENDPOINTS)
+
+REQUEST_HEADERS = {
+    "User-Agent": "office-ticker/1.1",
+    "Accept": "application/json,text/plain,*/*",
+    # Scoreboards are large, repetitive JSON; compressed they're 5-10x smaller
+    "Accept-Encoding": "gzip, deflate",
+}
+
+# Transient failures (connection errors, timeouts, 429, 5xx) are retried
+# with exponential backoff + jitter: ~0.2s, ~0.4s, ...
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.2
+RETRY_AFTER_MAX = 30
+
+REDIRECT_CODES = {301, 302, 303, 307, 308}
+MAX_REDIRECTS = 5
+
+# Idle keep-alive connections, shared by all fetch threads.
+# Every endpoint lives on site.api.espn.com, so reusing a connection
+# skips the TCP + TLS handshake on every request after the first.
+_pool_lock = threading.Lock()
+_idle_conns: dict[tuple[str, str], list[http.client.HTTPConnection]] = {}
+
+def _new_connection(scheme: str, host: str) -> http.client.HTTPConnection:
+    if scheme == "https":
+        return http.client.HTTPSConnection(host, timeout=30)
+    return http.client.HTTPConnection(host, timeout=30)
+
+def _checkout(scheme: str, host: str) -> tuple[http.client.HTTPConnection, bool]:
+    """An idle pooled connection if there is one, else a new one; plus whether it was pooled."""
+    with _pool_lock:
+        conns = _idle_conns.get((scheme, host))
+        if conns:
+            return conns.pop(), True
+    return _new_connection(scheme, host), False
+
+def _checkin(scheme: str, host: str, conn: http.client.HTTPConnection) -> None:
+    with _pool_lock:
+        conns = _idle_conns.setdefault((scheme, host), [])
+        if len(conns) < FETCH_WORKERS:
+            conns.append(conn)
+            return
+    conn.close()
+
+def _decode_body(body: bytes, encoding: str | None) -> bytes:
+    encoding = (encoding or "").strip().lower()
+    if encoding == "gzip":
+        return gzip.decompress(body)
+    if encoding == "deflate":
+        # "deflate" is supposed to be zlib-wrapped, but some servers send raw
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    return body
+
+def loads_json(raw: bytes):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def dumps_json(obj, indent: bool = False) -> bytes:
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+def write_atomic(path: str, payload: bytes) -> None:
+    """
+    Write via a temp file + rename so readers (and a killed run) only ever
+    see the old or the new complete file, never a truncated one.
+    """
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+def slim_scoreboard(scoreboard: dict) -> dict:
+    """
+    Keep only the event fields build_items reads. Scoreboards also carry
+    odds, broadcasts, venues, leaders, etc.; dropping them right after
+    parsing frees that memory early and keeps cache entries small.
+    """
+    events = []
+    for ev in (scoreboard.get("events") or [])[:MAX_ITEMS]:
+        comps = ev.get("competitions") or []
+        comp = comps[0] if comps else {}
+        status = (comp.get("status") or {}).get("type") or {}
+        competitors = []
+        for c in comp.get("competitors") or []:
+            team = c.get("team") or {}
+            competitors.append({
+                "homeAway": c.get("homeAway"),
+                "score": c.get("score"),
+                "team": {
+                    "shortDisplayName": team.get("shortDisplayName"),
+                    "displayName": team.get("displayName"),
+                },
+            })
+        events.append({
+            "name": ev.get("name"),
+            "shortName": ev.get("shortName"),
+            "competitions": [{
+                "date": comp.get("date"),
+                "status": {"type": {"state": status.get("state")}},
+                "competitors": competitors,
+            }],
+        })
+    return {"events": events}
+
+def _max_age(cache_control: str | None) -> int:
+    """Seconds a response may be reused for, per its Cache-Control header."""
+    directives = {}
+    for part in (cache_control or "").split(","):
+        name, _, value = part.strip().partition("=")
+        directives[name.strip().lower()] = value.strip().strip('"')
+    if "no-store" in directives or "no-cache" in directives:
+        return 0
+    try:
+        return max(int(directives.get("max-age", 0)), 0)
+    except ValueError:
+        return 0
+
+def _cache_path(url: str) -> str:
+    return os.path.join(CACHE_DIR, hashlib.sha1(url.encode("utf-8")).hexdigest() + ".json")
+
+def _cache_load(url: str) -> dict | None:
+    """Cached entry for url, fresh or not (stale ones can still revalidate)."""
+    try:
+        with open(_cache_path(url), "rb") as f:
+            entry = loads_json(f.read())
+    except (OSError, ValueError):
+        return None
+    return entry if isinstance(entry, dict) and "body" in entry else None
+
+def _cache_put(url: str, payload: dict, ttl: int,
+               etag: str | None = None, last_modified: str | None = None) -> None:
+    # Worth keeping if it's fresh for a while or can be revalidated later
+    if ttl <= 0 and not etag and not last_modified:
+        return
+    entry = {"exp": time.time() + ttl, "body": payload}
+    if etag:
+        entry["etag"] = etag
+    if last_modified:
+        entry["last_modified"] = last_modified
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        write_atomic(_cache_path(url), dumps_json(entry))
+    except OSError as e:
+        # The cache is only an optimization; never fail a run over it
+        print(f"Could not write cache entry for {url}: {e}")
+
+def _get_once(url: str, headers: dict) -> tuple[http.client.HTTPResponse, bytes]:
+    parts = urllib.parse.urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path = f"{path}?{parts.query}"
+
+    conn, pooled = _checkout(parts.scheme, parts.netloc)
+    while True:
+        try:
+            conn.request("GET", path, headers=headers)
+            resp = conn.getresponse()
+            body = resp.read()
+            break
+        except (http.client.HTTPException, OSError) as e:
+            conn.close()
+            # A pooled connection may have been closed by the server while
+            # idle; retry once on a brand-new one. Failures on a new
+            # connection (and timeouts) are left to fetch_with_retry.
+            if not pooled or isinstance(e, TimeoutError):
+                raise
+            conn, pooled = _new_connection(parts.scheme, parts.netloc), False
+
+    if resp.will_close:
+        conn.close()
+    else:
+        _checkin(parts.scheme, parts.netloc, conn)
+    return resp, body
+
+def _get(url: str, headers: dict) -> tuple[http.client.HTTPResponse, bytes]:
+    """GET over the connection pool, following redirects like urlopen did."""
+    for _ in range(MAX_REDIRECTS + 1):
+        resp, body = _get_once(url, headers)
+        location = resp.getheader("Location")
+        if resp.status not in REDIRECT_CODES or not location:
+            return resp, body
+        url = urllib.parse.urljoin(url, location)
+    raise urllib.error.HTTPError(url, resp.status, "Too many redirects", resp.headers, None)
+
+def prune_cache(max_age: float = CACHE_KEEP_SECONDS) -> None:
+    """
+    Delete cache files not written for max_age seconds. Every fetch or
+    revalidation rewrites its entry, so this only drops URLs for date
+    ranges we've stopped requesting.
+    """
+    cutoff = time.time() - max_age
+    try:
+        names = os.listdir(CACHE_DIR)
+    except OSError:
+        return
+    for name in names:
+        path = os.path.join(CACHE_DIR, name)
+        try:
+            if os.path.getmtime(path) < cutoff:
+                os.remove(path)
+        except OSError:
+            pass
+
 def fetch_json(url: str) -> dict:
-    req = urllib.request.Request(
+    entry = _cache_load(url)
+    if entry and entry.get("exp", 0) > time.time():
+        return entry["body"]
+
+    headers = dict(REQUEST_HEADERS)
+    if entry:
+        # Conditional GET: an unchanged scoreboard comes back as an empty 304
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    resp, body = _get(url, headers)
+
+    if resp.status == 304 and entry:
+        payload = entry["body"]
+    elif resp.status == 200:
+        body = _decode_body(body, resp.getheader("Content-Encoding"))
+        payload = slim_scoreboard(loads_json(body))
+    else:
+        raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.headers, None)
+
+    # A 304 may omit validators it isn't changing; keep the ones we sent
+    _cache_put(
         url,
-        headers={
-            "User-Agent": "office-ticker/1.1",
-            "Accept": "application/json,text/plain,*/*",
-        },
+        payload,
+        _max_age(resp.getheader("Cache-Control")),
+        etag=resp.getheader("ETag") or (entry or {}).get("etag"),
+        last_modified=resp.getheader("Last-Modified") or (entry or {}).get("last_modified"),
     )
-    with urllib.request.urlopen(req, timeout=30) as resp:
-        return json.loads(resp.read().decode("utf-8"))
+    return payload
+
+def _retry_delay(attempt: int, retry_after: str | None = None) -> float:
+    # Honor a server-sent Retry-After (seconds form), within reason
+    if retry_after and retry_after.strip().isdigit():
+        return min(float(retry_after.strip()), RETRY_AFTER_MAX)
+    return (2 ** attempt) * RETRY_BASE_DELAY + random.random() * RETRY_BASE_DELAY / 2
+
+def fetch_with_retry(url: str, attempts: int = RETRY_ATTEMPTS) -> dict:
+    """fetch_json, retrying transient failures; other errors raise right away."""
+    for attempt in range(attempts):
+        last = attempt == attempts - 1
+        try:
+            return fetch_json(url)
+        except urllib.error.HTTPError as e:
+            if last or (e.code < 500 and e.code != 429):
+                raise
+            delay = _retry_delay(attempt, e.headers.get("Retry-After") if e.headers else None)
+            reason = f"HTTP {e.code}"
+        except (http.client.HTTPException, OSError) as e:
+            if last:
+                raise
+            delay = _retry_delay(attempt)
+            reason = str(e) or type(e).__name__
+        print(f"Retrying {url} in {delay:.2f}s ({reason})")
+        time.sleep(delay)
+
+def fetch_all(urls: list[str]) -> list:
+    """
+    Fetch every URL concurrently (the work is all network wait).
+    A failed fetch comes back as its exception instead of raising,
+    so one bad league doesn't take down the rest of the batch.
+    """
+    def fetch_one(url: str):
+        try:
+            return fetch_with_retry(url)
+        except Exception as e:
+            return e
+
+    if not urls:
+        return []
+    with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(urls))) as ex:
+        return list(ex.map(fetch_one, urls))
 
 def yyyymmdd(dt: datetime) -> str:
     return dt.strftime("%Y%m%d")
 
-def with_dates(url: str, dates_value: str) -> str:
-    # Preserve existing query params
-    if "?" in url:
-        return f"{url}&dates={dates_value}"
-    return f"{url}?dates={dates_value}"
+def dated_urls(today_range: str, finals_range: str):
+    """Yield (league, mode, url) for every date-filtered scoreboard request."""
+    for league, base_url in ENDPOINTS.items():
+        # Preserve existing query params
+        sep = "&" if "?" in base_url else "?"
+        yield league, "today", f"{base_url}{sep}dates={today_range}"
+        yield league, "finals", f"{base_url}{sep}dates={finals_range}"
 
-def build_items(scoreboard: dict, league_label: str, mode: str) -> list[dict]:
+@lru_cache(maxsize=1024)
+def local_start(iso: str) -> tuple[date, str] | None:
+    """
+    Local calendar date and "7:30 PM CT" label for an ESPN start time.
+    Cached: most games on a slate share a handful of start times.
+    """
+    try:
+        # fromisoformat only accepts a trailing "Z" from Python 3.11 on
+        dt = datetime.fromisoformat(iso.replace("Z", "+00:00")).astimezone(LOCAL_TZ)
+    except (TypeError, ValueError):
+        return None
+    # Formatted by hand since strftime's "%-I" isn't portable
+    hour12 = dt.hour % 12 or 12
+    ampm = "AM" if dt.hour < 12 else "PM"
+    return dt.date(), f"{hour12}:{dt.minute:02d} {ampm} CT"
+
+# Ticker text per game state. Each returns (ok, text); a formatter that
+# lacks what it needs falls back to the next one (final/live -> pregame),
+# and build_items falls back to the event name when even that fails.
+def _fmt_pregame(home_team, home_score, away_team, away_score, time_part) -> tuple[bool, str]:
+    if time_part and away_team and home_team:
+        return True, f"{away_team} @ {home_team} {time_part}"
+    return False, ""
+
+def _fmt_final(home_team, home_score, away_team, away_score, time_part) -> tuple[bool, str]:
+    if home_score is not None and away_score is not None:
+        return True, f"FINAL: {away_team} {away_score} — {home_team} {home_score}"
+    return _fmt_pregame(home_team, home_score, away_team, away_score, time_part)
+
+def _fmt_live(home_team, home_score, away_team, away_score, time_part) -> tuple[bool, str]:
+    if home_score is not None and away_score is not None:
+        return True, f"LIVE: {away_team} {away_score} — {home_team} {home_score}"
+    return _fmt_pregame(home_team, home_score, away_team, away_score, time_part)
+
+STATE_FORMATTERS = {"post": _fmt_final, "in": _fmt_live}
+
+def build_items(scoreboard: dict, league_label: str, mode: str,
+                cap: int = MAX_ITEMS) -> list[dict]:
     """
     mode:
       - "today": scheduled/in-progress (pre + in)
       - "finals": post
+    Stops as soon as it has `cap` items.
     """
     items = []
+    if cap <= 0:
+        return items
     events = scoreboard.get("events") or []
-    for ev in events[:250]:
+    today = datetime.now(LOCAL_TZ).date()
+    for ev in events[:MAX_ITEMS]:
         comps = (ev.get("competitions") or [])
         comp = comps[0] if comps else {}
         status = (comp.get("status") or {}).get("type") or {}
         state = (status.get("state") or "").lower()  # pre / in / post
-        # Strict "today" filter using local (CT) calendar date
-if mode == "today":
-    iso = comp.get("date")
-    if not iso:
-        continue
-    try:
-        dt_utc = datetime.fromisoformat(iso.replace("Z", "+00:00"))
-        dt_ct = dt_utc + timedelta(hours=-6)
-        if dt_ct.date() != datetime.now(timezone.utc).date():
-            continue
-    except Exception:
-        continue
+
+        # Filter on state first: it's one lookup, and a finals scoreboard is
+        # mostly pre/in games we'd otherwise parse dates and teams for
         if mode == "finals" and state != "post":
             continue
         if mode == "today" and state == "post":
             continue
 
+        iso = comp.get("date")
+        start = local_start(iso) if isinstance(iso, str) else None
+
+        # Strict "today" filter using local (CT) calendar date
+        if mode == "today" and (start is None or start[0] != today):
+            continue
+
         competitors = comp.get("competitors") or []
         if len(competitors) >= 2:
             home = next((c for c in competitors if c.get("homeAway") == "home"), competitors[0])
             away = next((c for c in competitors if c.get("homeAway") == "away"), competitors[1])
+            home_info = home.get("team") or {}
+            away_info = away.get("team") or {}
 
-            home_team = ((home.get("team") or {}).get("shortDisplayName")
-                         or (home.get("team") or {}).get("displayName")
-                         or "HOME")
-            away_team = ((away.get("team") or {}).get("shortDisplayName")
-                         or (away.get("team") or {}).get("displayName")
-                         or "AWAY")
+            home_team = home_info.get("shortDisplayName") or home_info.get("displayName") or "HOME"
+            away_team = away_info.get("shortDisplayName") or away_info.get("displayName") or "AWAY"
 
             home_score = home.get("score")
             away_score = away.get("score")
@@ -83,52 +429,90 @@ if mode == "today":
             home_team = away_team = ""
             home_score = away_score = None
 
-        # Time (we’ll print ET label; exact DST accuracy isn’t critical for a ticker)
-        time_part = ""
-        iso = comp.get("date")
-        if iso:
-            try:
-                dt_utc = datetime.fromisoformat(iso.replace("Z", "+00:00"))
-                dt_et = dt_utc + timedelta(hours=-6)
-                time_part = dt_et.strftime("%-I:%M %p CT")
-            except Exception:
-                time_part = ""
-
-        if state == "post" and home_score is not None and away_score is not None:
-            text = f"FINAL: {away_team} {away_score} — {home_team} {home_score}"
-        elif state == "in" and home_score is not None and away_score is not None:
-            text = f"LIVE: {away_team} {away_score} — {home_team} {home_score}"
-        elif time_part and away_team and home_team:
-            text = f"{away_team} @ {home_team} {time_part}"
-        else:
+        time_part = start[1] if start else ""
+
+        ok, text = STATE_FORMATTERS.get(state, _fmt_pregame)(
+            home_team, home_score, away_team, away_score, time_part)
+        if not ok:
             # fallback to event name
             text = ev.get("name") or ev.get("shortName") or "Game"
 
         items.append({"league": league_label, "text": text})
+        if len(items) >= cap:
+            break
 
     return items
 
-def text_has_team(text: str, team: str) -> bool:
-    t = team.lower()
-    s = text.lower()
-    # word-ish boundary matching
-    return f" {t} " in f" {s} " or s.startswith(f"{t} ")
+def favorite_patterns(fav_map: dict) -> dict[str, re.Pattern]:
+    """
+    One case-insensitive alternation of team names per league, so each
+    item's text is scanned once no matter how many favorites there are.
+    """
+    patterns = {}
+    for league_key, teams in fav_map.items():
+        if not teams:
+            continue
+        # Longest first so "Miami (OH)" wins over "Miami"
+        alts = sorted((re.escape(t) for t in teams), key=len, reverse=True)
+        # word-ish boundary matching that also works for names ending in punctuation
+        patterns[league_key] = re.compile(r"(?<!\w)(" + "|".join(alts) + r")(?!\w)", re.IGNORECASE)
+    return patterns
+
+def build_favorites(data: dict) -> list[dict]:
+    """
+    One ticker item per favorite team: the first today/finals item
+    mentioning the team, or a "no game" placeholder. Adds the team's
+    logo when favoriteLogos has one.
+    """
+    fav_map = data.get("favoritesTeams", {})
+    fav_logos = data.get("favoriteLogos", {})
+    # Walk both lists in place rather than concatenating a copy
+    candidates = chain(data.get("today", []), data.get("finals", []))
+
+    # First hit per (league, lowercased team), in ticker order
+    patterns = favorite_patterns(fav_map)
+    hits = {}
+    for it in candidates:
+        league_key = it.get("league")
+        pattern = patterns.get(league_key)
+        if pattern is None:
+            continue
+        for m in pattern.finditer(it.get("text") or ""):
+            hits.setdefault((league_key, m.group(1).lower()), it)
+
+    favs = []
+    for league_key, teams in fav_map.items():
+        for team in teams:
+            hit = hits.get((league_key, team.lower()))
+
+            if hit:
+                # Copy the item so we can safely add logo without mutating shared objects
+                item = {"league": hit.get("league", league_key), "text": hit.get("text", "")}
+            else:
+                item = {"league": league_key, "text": f"{team} — no game/result today"}
+
+            # Attach logo for this favorite team if we have one
+            logo_url = fav_logos.get(team)
+            if logo_url:
+                item["logo"] = logo_url
+
+            favs.append(item)
+
+    return favs
 
 def load_data() -> dict:
-    with open(DATA_PATH, "r", encoding="utf-8") as f:
-        return json.load(f)
+    with open(DATA_PATH, "rb") as f:
+        return loads_json(f.read())
 
 def save_data(data: dict) -> None:
-    with open(DATA_PATH, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-        f.write("\n")
+    write_atomic(DATA_PATH, dumps_json(data, indent=True) + b"\n")
 
 def main():
     data = load_data()
+    prune_cache()
 
-    # Use "local" day as America/Chicago-ish so “today” matches you.
-    # (Good enough without timezone libs)
-    now_local = datetime.now(timezone.utc) + timedelta(hours=-6)
+    # Use the local (America/Chicago) day so “today” matches you.
+    now_local = datetime.now(LOCAL_TZ)
     today = now_local.date()
     yesterday = (now_local - timedelta(days=1)).date()
     tomorrow = (now_local + timedelta(days=1)).date()
@@ -144,23 +528,29 @@ def main():
     new_today = []
     new_finals = []
 
+    # 1) Try date-range filtered, all leagues at once
+    jobs = list(dated_urls(today_range, finals_range))
+    results = fetch_all([url for _, _, url in jobs])
+    scoreboards = {(league, mode): sb for (league, mode, _), sb in zip(jobs, results)}
+
     for league, base_url in ENDPOINTS.items():
         try:
-            # 1) Try date-range filtered
-            url_today = with_dates(base_url, today_range)
-            url_finals = with_dates(base_url, finals_range)
-
-            sb_today = fetch_json(url_today)
-            sb_finals = fetch_json(url_finals)
+            sb_today = scoreboards[(league, "today")]
+            sb_finals = scoreboards[(league, "finals")]
+            for sb in (sb_today, sb_finals):
+                if isinstance(sb, Exception):
+                    raise sb
 
-            items_today = build_items(sb_today, league, "today")
-            items_finals = build_items(sb_finals, league, "finals")
+            # Only build as many items as still fit under MAX_ITEMS
+            today_room = MAX_ITEMS - len(new_today)
+            items_today = build_items(sb_today, league, "today", cap=today_room)
+            items_finals = build_items(sb_finals, league, "finals", cap=MAX_ITEMS - len(new_finals))
 
             # 2) Fallback: if date-filter gives nothing, try without dates param
-            if not items_today:
+            if not items_today and today_room > 0:
                 print(f"[{league}] No TODAY items via dates range. Trying without dates…")
-                sb_fallback = fetch_json(base_url)
-                items_today = build_items(sb_fallback, league, "today")
+                sb_fallback = fetch_with_retry(base_url)
+                items_today = build_items(sb_fallback, league, "today", cap=today_room)
 
             if not items_finals:
                 # finals can legitimately be empty sometimes; no fallback needed
@@ -175,78 +565,17 @@ def main():
 
     # Only overwrite if we got something (prevents blanking everything)
     if new_today:
-        data["today"] = new_today[:250]
+        data["today"] = new_today
     else:
         print("No TODAY items found across leagues; keeping existing data['today'].")
 
     if new_finals:
-        data["finals"] = new_finals[:250]
+        data["finals"] = new_finals
     else:
         print("No FINALS items found across leagues; keeping existing data['finals'].")
 
-   # Favorites (with optional team logos)
-fav_map = data.get("favoritesTeams", {})
-fav_logos = data.get("favoriteLogos", {})  # NEW
-candidates = (data.get("today", []) + data.get("finals", []))
-
-favs = []
-
-def text_has_team(text: str, team: str) -> bool:
-    t = team.lower()
-    s = (text or "").lower()
-    return f" {t} " in f" {s} " or s.startswith(f"{t} ")
-
-for league_key, teams in fav_map.items():
-    for team in teams:
-        hit = next(
-            (it for it in candidates
-             if it.get("league") == league_key and text_has_team(it.get("text", ""), team)),
-            None
-        )
-
-        if hit:
-            item = {"league": hit.get("league", league_key), "text": hit.get("text", "")}
-        else:
-            item = {"league": league_key, "text": f"{team} — no game/result today"}
-
-        logo_url = fav_logos.get(team)
-        if logo_url:
-            item["logo"] = logo_url
-
-        favs.append(item)
-
-data["favorites"] = favs[:60]
-
     # Favorites (with optional team logos)
-fav_map = data.get("favoritesTeams", {})
-fav_logos = data.get("favoriteLogos", {})  # NEW
-candidates = (data.get("today", []) + data.get("finals", []))
-
-favs = []
-
-for league_key, teams in fav_map.items():
-    for team in teams:
-        hit = next(
-            (it for it in candidates
-             if it.get("league") == league_key and text_has_team(it.get("text", ""), team)),
-            None
-        )
-
-        if hit:
-            # Copy the item so we can safely add logo without mutating shared objects
-            item = {"league": hit.get("league", league_key), "text": hit.get("text", "")}
-        else:
-            item = {"league": league_key, "text": f"{team} — no game/result today"}
-
-        # Attach logo for this favorite team if we have one
-        logo_url = fav_logos.get(team)
-        if logo_url:
-            item["logo"] = logo_url
-
-        favs.append(item)
-
-orites"] = favs[:60]
-
+    data["favorites"] = build_favorites(data)[:60]
 
     # Stamp status
     data["statusLine"] = "NFL • NCAA FB • MLB • NHL — auto-updated"